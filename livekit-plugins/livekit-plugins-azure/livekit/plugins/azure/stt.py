@@ -14,10 +14,12 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import os
+import queue
 import weakref
-from copy import deepcopy
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, replace
 from typing import Any, cast
 
 import azure.cognitiveservices.speech as speechsdk  # type: ignore
@@ -37,8 +39,29 @@ from livekit.agents.utils import is_given
 
 from .log import logger
 
+# optional pool of PCM staging buffers shared across streams, opt-in with
+# LK_AZURE_PCM_POOL=1; bounded so idle slabs don't pin memory
+_PCM_POOL: deque[bytearray] = deque(maxlen=32)
+_PCM_POOL_ENABLED = os.environ.get("LK_AZURE_PCM_POOL", "0") == "1"
 
-@dataclass
+
+def _acquire_pcm_buf() -> bytearray:
+    if _PCM_POOL_ENABLED:
+        try:
+            return _PCM_POOL.popleft()
+        except IndexError:
+            pass
+
+    return bytearray()
+
+
+def _release_pcm_buf(buf: bytearray) -> None:
+    if _PCM_POOL_ENABLED:
+        buf.clear()
+        _PCM_POOL.append(buf)
+
+
+@dataclass(frozen=True)
 class STTOptions:
     speech_key: NotGivenOr[str]
     speech_region: NotGivenOr[str]
@@ -129,6 +152,11 @@ class STT(stt.STT):
             logger.warning("speech_region and speech_endpoint both are set, using speech_endpoint")
             speech_region = NOT_GIVEN
 
+        if is_given(phrase_list) and phrase_list:
+            # dedupe once up front (order-preserving); addPhrase is one native
+            # call per entry on every recognizer build
+            phrase_list = list(dict.fromkeys(phrase_list))
+
         self._config = STTOptions(
             speech_key=speech_key,
             speech_region=speech_region,
@@ -170,9 +198,14 @@ class STT(stt.STT):
         language: NotGivenOr[str] = NOT_GIVEN,
         conn_options: APIConnectOptions = DEFAULT_API_CONNECT_OPTIONS,
     ) -> SpeechStream:
-        config = deepcopy(self._config)
-        if is_given(language):
-            config.language = [language]
+        # only the mutable list fields need cloning, everything else is immutable
+        config = replace(
+            self._config,
+            language=[language] if is_given(language) else list(self._config.language),
+            phrase_list=list(self._config.phrase_list)
+            if is_given(self._config.phrase_list) and self._config.phrase_list
+            else self._config.phrase_list,
+        )
         stream = SpeechStream(stt=self, opts=config, conn_options=conn_options)
         self._streams.add(stream)
         return stream
@@ -182,16 +215,22 @@ class STT(stt.STT):
             if isinstance(language, str):
                 language = [language]
             language = cast(list[str], language)
-            self._config.language = language
+            self._config = replace(self._config, language=language)
             for stream in self._streams:
                 stream.update_options(language=language)
 
 
 class SpeechStream(stt.SpeechStream):
+    # speech lifecycle events carry no per-call state; consumers treat
+    # SpeechEvent as read-only so the same instances can be reused
+    _START_OF_SPEECH_EVENT = stt.SpeechEvent(type=stt.SpeechEventType.START_OF_SPEECH)
+    _END_OF_SPEECH_EVENT = stt.SpeechEvent(type=stt.SpeechEventType.END_OF_SPEECH)
+
     def __init__(self, *, stt: STT, opts: STTOptions, conn_options: APIConnectOptions) -> None:
         super().__init__(stt=stt, conn_options=conn_options, sample_rate=opts.sample_rate)
         self._opts = opts
         self._speaking = False
+        self._recognizer: speechsdk.SpeechRecognizer | None = None
 
         self._session_stopped_event = asyncio.Event()
         self._session_started_event = asyncio.Event()
@@ -199,11 +238,75 @@ class SpeechStream(stt.SpeechStream):
         self._loop = asyncio.get_running_loop()
         self._reconnect_event = asyncio.Event()
 
+        # transcript events from the SDK's worker thread, drained by _pump_transcripts
+        self._xq: queue.SimpleQueue[stt.SpeechEvent | None] = queue.SimpleQueue()
+        self._xq_ready = asyncio.Event()
+
+    def _enqueue_transcript(self, ev: stt.SpeechEvent | None) -> None:
+        # wake the pump only on the empty->non-empty transition; follow-up
+        # events ride the same wakeup and are drained in one batch
+        self._xq.put_nowait(ev)
+        if not self._xq_ready.is_set():
+            with contextlib.suppress(RuntimeError):
+                self._loop.call_soon_threadsafe(self._xq_ready.set)
+
     def update_options(self, *, language: list[str]) -> None:
-        self._opts.language = language
+        # the SDK only reads the language settings at recognizer construction,
+        # so a real change always requires a reconnect; only skip the no-ops
+        if language == self._opts.language:
+            return
+
+        self._opts = replace(self._opts, language=language)
         self._reconnect_event.set()
 
     async def _run(self) -> None:
+        pump_task = asyncio.create_task(self._pump_transcripts())
+        try:
+            await self._run_recognizer_loop()
+        finally:
+            self._enqueue_transcript(None)
+            await pump_task
+
+    async def _pump_transcripts(self) -> None:
+        # transcript callbacks fire at 10+ events/sec during active speech;
+        # draining on the loop after one wakeup per burst avoids both a
+        # call_soon_threadsafe (loop lock + self-pipe write) per event and a
+        # worker thread parked in a blocking get between bursts
+        while True:
+            await self._xq_ready.wait()
+            self._xq_ready.clear()
+
+            batch: list[stt.SpeechEvent | None] = []
+            while True:
+                try:
+                    batch.append(self._xq.get_nowait())
+                except queue.Empty:
+                    break
+
+            # interim transcripts are idempotent, only the latest one matters; when
+            # the consumer lagged behind, drop the stale ones instead of forwarding
+            last_interim: stt.SpeechEvent | None = None
+            for ev in reversed(batch):
+                if ev is not None and ev.type == stt.SpeechEventType.INTERIM_TRANSCRIPT:
+                    last_interim = ev
+                    break
+
+            for ev in batch:
+                if ev is None:
+                    return
+
+                if ev.type == stt.SpeechEventType.INTERIM_TRANSCRIPT and ev is not last_interim:
+                    continue
+
+                with contextlib.suppress(utils.aio.ChanClosed):
+                    self._event_ch.send_nowait(ev)
+
+    async def _run_recognizer_loop(self) -> None:
+        # coalesce small frames into ~100ms writes so each one crosses the
+        # native boundary once instead of once per 10-20ms frame
+        max_write_size = self._opts.sample_rate // 10 * self._opts.num_channels * 2
+        flush_interval = 0.05
+
         while True:
             self._session_stopped_event.clear()
 
@@ -214,7 +317,11 @@ class SpeechStream(stt.SpeechStream):
                     channels=self._opts.num_channels,
                 )
             )
-            self._recognizer = _create_speech_recognizer(config=self._opts, stream=self._stream)
+            # recognizer construction and recognition startup perform blocking
+            # native work, keep them off the event loop like the cleanup path
+            self._recognizer = await asyncio.to_thread(
+                _create_speech_recognizer, config=self._opts, stream=self._stream
+            )
             self._recognizer.recognizing.connect(self._on_recognizing)
             self._recognizer.recognized.connect(self._on_recognized)
             self._recognizer.speech_start_detected.connect(self._on_speech_start)
@@ -222,7 +329,7 @@ class SpeechStream(stt.SpeechStream):
             self._recognizer.session_started.connect(self._on_session_started)
             self._recognizer.session_stopped.connect(self._on_session_stopped)
             self._recognizer.canceled.connect(self._on_canceled)
-            self._recognizer.start_continuous_recognition()
+            await asyncio.to_thread(self._recognizer.start_continuous_recognition)
 
             try:
                 await asyncio.wait_for(
@@ -230,9 +337,30 @@ class SpeechStream(stt.SpeechStream):
                 )
 
                 async def process_input() -> None:
-                    async for input in self._input_ch:
-                        if isinstance(input, rtc.AudioFrame):
-                            self._stream.write(input.data.tobytes())
+                    write_buf = _acquire_pcm_buf()
+                    last_flush = self._loop.time()
+                    try:
+                        async for input in self._input_ch:
+                            if isinstance(input, rtc.AudioFrame):
+                                write_buf += input.data
+                                if (
+                                    len(write_buf) >= max_write_size
+                                    or self._loop.time() - last_flush > flush_interval
+                                ):
+                                    # PushAudioInputStream.write is a ctypes binding
+                                    # that only accepts bytes, one copy per flush
+                                    self._stream.write(bytes(write_buf))
+                                    write_buf.clear()
+                                    last_flush = self._loop.time()
+                            elif write_buf:
+                                self._stream.write(bytes(write_buf))
+                                write_buf.clear()
+                                last_flush = self._loop.time()
+                    finally:
+                        if write_buf:
+                            self._stream.write(bytes(write_buf))
+
+                        _release_pcm_buf(write_buf)
 
                 process_input_task = asyncio.create_task(process_input())
                 wait_reconnect_task = asyncio.create_task(self._reconnect_event.wait())
@@ -259,51 +387,51 @@ class SpeechStream(stt.SpeechStream):
                 self._stream.close()
                 await self._session_stopped_event.wait()
             finally:
+                recognizer, self._recognizer = self._recognizer, None
 
-                def _cleanup() -> None:
-                    self._recognizer.stop_continuous_recognition()
-                    del self._recognizer
+                def _cleanup(recognizer: speechsdk.SpeechRecognizer | None) -> None:
+                    if recognizer is not None:
+                        recognizer.stop_continuous_recognition()
 
-                await asyncio.to_thread(_cleanup)
+                await asyncio.to_thread(_cleanup, recognizer)
 
-    def _on_recognized(self, evt: speechsdk.SpeechRecognitionEventArgs) -> None:
-        detected_lg = speechsdk.AutoDetectSourceLanguageResult(evt.result).language
-        text = evt.result.text.strip()
-        if not text:
-            return
+    def _detected_language(self, evt: speechsdk.SpeechRecognitionEventArgs) -> str:
+        language = self._opts.language
+        if len(language) == 1:
+            # auto-detection is inactive with a single candidate, skip the
+            # native AutoDetectSourceLanguageResult lookup on every event
+            return language[0]
 
-        if not detected_lg and self._opts.language:
-            detected_lg = self._opts.language[0]
+        detected_lg: str = speechsdk.AutoDetectSourceLanguageResult(evt.result).language
+        if not detected_lg and language:
+            detected_lg = language[0]
 
-        final_data = stt.SpeechData(language=detected_lg, confidence=1.0, text=evt.result.text)
+        return detected_lg
 
-        with contextlib.suppress(RuntimeError):
-            self._loop.call_soon_threadsafe(
-                self._event_ch.send_nowait,
-                stt.SpeechEvent(
-                    type=stt.SpeechEventType.FINAL_TRANSCRIPT, alternatives=[final_data]
-                ),
-            )
-
-    def _on_recognizing(self, evt: speechsdk.SpeechRecognitionEventArgs) -> None:
-        detected_lg = speechsdk.AutoDetectSourceLanguageResult(evt.result).language
-        text = evt.result.text.strip()
-        if not text:
+    def _on_recognized(self, evt: speechsdk.SpeechRecognitionEventArgs) -> None:
+        text = evt.result.text
+        if not text or text.isspace():
             return
 
-        if not detected_lg and self._opts.language:
-            detected_lg = self._opts.language[0]
+        detected_lg = self._detected_language(evt)
+        final_data = stt.SpeechData(language=detected_lg, confidence=1.0, text=text)
+        self._enqueue_transcript(
+            stt.SpeechEvent(type=stt.SpeechEventType.FINAL_TRANSCRIPT, alternatives=[final_data])
+        )
 
-        interim_data = stt.SpeechData(language=detected_lg, confidence=0.0, text=evt.result.text)
+    def _on_recognizing(self, evt: speechsdk.SpeechRecognitionEventArgs) -> None:
+        text = evt.result.text
+        if not text or text.isspace():
+            return
 
-        with contextlib.suppress(RuntimeError):
-            self._loop.call_soon_threadsafe(
-                self._event_ch.send_nowait,
-                stt.SpeechEvent(
-                    type=stt.SpeechEventType.INTERIM_TRANSCRIPT,
-                    alternatives=[interim_data],
-                ),
+        detected_lg = self._detected_language(evt)
+        interim_data = stt.SpeechData(language=detected_lg, confidence=0.0, text=text)
+        self._enqueue_transcript(
+            stt.SpeechEvent(
+                type=stt.SpeechEventType.INTERIM_TRANSCRIPT,
+                alternatives=[interim_data],
             )
+        )
 
     def _on_speech_start(self, evt: speechsdk.SpeechRecognitionEventArgs) -> None:
         if self._speaking:
@@ -312,10 +440,7 @@ class SpeechStream(stt.SpeechStream):
         self._speaking = True
 
         with contextlib.suppress(RuntimeError):
-            self._loop.call_soon_threadsafe(
-                self._event_ch.send_nowait,
-                stt.SpeechEvent(type=stt.SpeechEventType.START_OF_SPEECH),
-            )
+            self._loop.call_soon_threadsafe(self._event_ch.send_nowait, self._START_OF_SPEECH_EVENT)
 
     def _on_speech_end(self, evt: speechsdk.SpeechRecognitionEventArgs) -> None:
         if not self._speaking:
@@ -324,10 +449,7 @@ class SpeechStream(stt.SpeechStream):
         self._speaking = False
 
         with contextlib.suppress(RuntimeError):
-            self._loop.call_soon_threadsafe(
-                self._event_ch.send_nowait,
-                stt.SpeechEvent(type=stt.SpeechEventType.END_OF_SPEECH),
-            )
+            self._loop.call_soon_threadsafe(self._event_ch.send_nowait, self._END_OF_SPEECH_EVENT)
 
     def _on_session_started(self, evt: speechsdk.SpeechRecognitionEventArgs) -> None:
         self._session_started_event.set()
@@ -351,42 +473,74 @@ class SpeechStream(stt.SpeechStream):
             )
 
 
-def _create_speech_recognizer(
-    *, config: STTOptions, stream: speechsdk.audio.AudioInputStream
-) -> speechsdk.SpeechRecognizer:
+# the auth/segmentation settings rarely change between reconnects; caching the
+# configured SpeechConfig skips the repeated native property writes
+@functools.lru_cache(maxsize=4)
+def _cached_speech_config(
+    *,
+    subscription: NotGivenOr[str],
+    region: NotGivenOr[str],
+    endpoint: NotGivenOr[str],
+    host: NotGivenOr[str],
+    auth_token: NotGivenOr[str],
+    segmentation_silence_timeout_ms: NotGivenOr[int],
+    segmentation_max_time_ms: NotGivenOr[int],
+    segmentation_strategy: NotGivenOr[str],
+    profanity: NotGivenOr[speechsdk.enums.ProfanityOption],
+    explicit_punctuation: bool,
+) -> speechsdk.SpeechConfig:
     # let the SpeechConfig constructor to validate the arguments
     speech_config = speechsdk.SpeechConfig(
-        subscription=config.speech_key if is_given(config.speech_key) else None,
-        region=config.speech_region if is_given(config.speech_region) else None,
-        endpoint=config.speech_endpoint if is_given(config.speech_endpoint) else None,
-        host=config.speech_host if is_given(config.speech_host) else None,
-        auth_token=config.speech_auth_token if is_given(config.speech_auth_token) else None,
+        subscription=subscription if is_given(subscription) else None,
+        region=region if is_given(region) else None,
+        endpoint=endpoint if is_given(endpoint) else None,
+        host=host if is_given(host) else None,
+        auth_token=auth_token if is_given(auth_token) else None,
     )
 
-    if config.segmentation_silence_timeout_ms:
+    if segmentation_silence_timeout_ms:
         speech_config.set_property(
             speechsdk.enums.PropertyId.Speech_SegmentationSilenceTimeoutMs,
-            str(config.segmentation_silence_timeout_ms),
+            str(segmentation_silence_timeout_ms),
         )
-    if config.segmentation_max_time_ms:
+    if segmentation_max_time_ms:
         speech_config.set_property(
             speechsdk.enums.PropertyId.Speech_SegmentationMaximumTimeMs,
-            str(config.segmentation_max_time_ms),
+            str(segmentation_max_time_ms),
         )
-    if config.segmentation_strategy:
+    if segmentation_strategy:
         speech_config.set_property(
             speechsdk.enums.PropertyId.Speech_SegmentationStrategy,
-            str(config.segmentation_strategy),
+            str(segmentation_strategy),
         )
-    if is_given(config.profanity):
-        speech_config.set_profanity(config.profanity)
+    if is_given(profanity):
+        speech_config.set_profanity(profanity)
 
     # Set punctuation behavior if specified
-    if config.explicit_punctuation:
+    if explicit_punctuation:
         speech_config.set_service_property(
             "punctuation", "explicit", speechsdk.ServicePropertyChannel.UriQueryParameter
         )
 
+    return speech_config
+
+
+def _create_speech_recognizer(
+    *, config: STTOptions, stream: speechsdk.audio.AudioInputStream
+) -> speechsdk.SpeechRecognizer:
+    speech_config = _cached_speech_config(
+        subscription=config.speech_key,
+        region=config.speech_region,
+        endpoint=config.speech_endpoint,
+        host=config.speech_host,
+        auth_token=config.speech_auth_token,
+        segmentation_silence_timeout_ms=config.segmentation_silence_timeout_ms,
+        segmentation_max_time_ms=config.segmentation_max_time_ms,
+        segmentation_strategy=config.segmentation_strategy,
+        profanity=config.profanity,
+        explicit_punctuation=config.explicit_punctuation,
+    )
+
     kwargs: dict[str, Any] = {}
     if config.language and len(config.language) > 1:
         kwargs["auto_detect_source_language_config"] = (
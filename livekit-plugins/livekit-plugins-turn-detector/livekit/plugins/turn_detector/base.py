@@ -148,6 +148,18 @@ class _EUORunnerBase(_InferenceRunner):
                 f"Could not find model {HG_MODEL} with revision {revision}."
             ) from None
 
+        # warm up with a dummy input so the first real prediction doesn't pay the
+        # one-time kernel and allocator setup costs; this runs in the inference
+        # process at startup, before any job is dispatched
+        warmup_inputs = self._tokenizer(
+            "hello",
+            add_special_tokens=False,
+            return_tensors="np",
+            max_length=MAX_HISTORY_TOKENS,
+            truncation=True,
+        )
+        self._session.run(None, {"input_ids": warmup_inputs["input_ids"].astype("int64")})
+
     def run(self, data: bytes) -> bytes | None:
         data_json = json.loads(data)
         chat_ctx = data_json.get("chat_ctx", None)
@@ -155,7 +167,8 @@ class _EUORunnerBase(_InferenceRunner):
         if not chat_ctx:
             raise ValueError("chat_ctx is required on the inference input data")
 
-        start_time = time.perf_counter()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        start_time = time.perf_counter() if debug else 0.0
         text = self._format_chat_ctx(chat_ctx)
         inputs = self._tokenizer(
             text,
@@ -167,13 +180,14 @@ class _EUORunnerBase(_InferenceRunner):
         # run inference
         outputs = self._session.run(None, {"input_ids": inputs["input_ids"].astype("int64")})
         eou_probability = outputs[0].flatten()[-1]
-        end_time = time.perf_counter()
 
-        result: dict[str, Any] = {
-            "eou_probability": float(eou_probability),
-            "duration": round(end_time - start_time, 3),
-            "input": text,
-        }
+        result: dict[str, Any] = {"eou_probability": float(eou_probability)}
+        if debug:
+            # the timing and formatted transcript are only consumed by the debug
+            # log, don't pay to serialize them across IPC otherwise
+            result["duration"] = round(time.perf_counter() - start_time, 3)
+            result["input"] = text
+
         return json.dumps(result).encode()
 
     @classmethod
@@ -283,6 +297,11 @@ class EOUModelBase(ABC):
                 )
 
         messages = messages[-MAX_HISTORY_TURNS:]
+        if not messages:
+            # nothing to predict on; skip the IPC round-trip and model forward
+            # pass (the runner rejects an empty chat_ctx anyway)
+            return 0.0
+
         json_data = json.dumps({"chat_ctx": messages}).encode()
 
         result = await asyncio.wait_for(
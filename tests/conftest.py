@@ -15,6 +15,19 @@ from .toxic_proxy import Toxiproxy
 TEST_CONNECT_OPTIONS = dataclasses.replace(DEFAULT_API_CONNECT_OPTIONS, retry_interval=0.0)
 
 
+# optionalhook: older pytest-asyncio releases don't declare this hookspec
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    # uvloop is noticeably faster for the small-message asyncio primitives the
+    # tests lean on; fall back to the default loop where it isn't available
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+
+    return {"uvloop": uvloop.new_event_loop}
+
+
 @pytest.fixture
 def job_process(event_loop):
     utils.http_context._new_session_ctx()
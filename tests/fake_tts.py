@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import copy
 import time
-from typing import Literal
+from collections.abc import Awaitable, Callable
+from typing import Literal, TypeVar
 
 from pydantic import BaseModel
 
@@ -15,6 +17,33 @@ from livekit.agents.tts import (
     TTSCapabilities,
 )
 from livekit.agents.types import DEFAULT_API_CONNECT_OPTIONS, APIConnectOptions
+from livekit.agents.utils.aio.channel import ChanEmpty
+
+# push ~200ms frames: large enough to collapse per-chunk overhead in the
+# adapter/resampler/consumer chain, small enough to exercise streaming
+_CHUNK_MS = 200
+
+# reusable zero buffer (1s of 16-bit silence at 48kHz) so synthesis slices
+# silence instead of building a fresh bytes object per chunk
+_SILENCE = bytes(2 * 48000)
+
+_T = TypeVar("_T")
+
+
+class _EventQueue(asyncio.Queue[_T]):
+    """Chan-compatible signaling queue; non-blocking ops resolve to plain deque ops."""
+
+    def send_nowait(self, value: _T) -> None:
+        self.put_nowait(value)
+
+    def recv_nowait(self) -> _T:
+        try:
+            return self.get_nowait()
+        except asyncio.QueueEmpty:
+            raise ChanEmpty from None
+
+    async def recv(self) -> _T:
+        return await self.get()
 
 
 class FakeTTSResponse(BaseModel):
@@ -54,13 +83,16 @@ class FakeTTS(TTS):
         self._fake_timeout = fake_timeout
         self._fake_audio_duration = fake_audio_duration
         self._fake_exception = fake_exception
+        # injectable time source: tests that only care about causal ordering
+        # can swap in an instant sleep to skip the real fake_timeout waits
+        self._sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
         self._fake_response_map: dict[str, FakeTTSResponse] = {}
         if fake_responses is not None:
             for response in fake_responses:
                 self._fake_response_map[response.input] = response
 
-        self._synthesize_ch = utils.aio.Chan[FakeChunkedStream]()
-        self._stream_ch = utils.aio.Chan[FakeSynthesizeStream]()
+        self._synthesize_ch: _EventQueue[FakeChunkedStream] = _EventQueue()
+        self._stream_ch: _EventQueue[FakeSynthesizeStream] = _EventQueue()
 
     def update_options(
         self,
@@ -78,12 +110,35 @@ class FakeTTS(TTS):
         if utils.is_given(fake_exception):
             self._fake_exception = fake_exception
 
+    def reset(
+        self,
+        *,
+        sample_rate: int = 24000,
+        num_channels: int = 1,
+        fake_timeout: float | None = None,
+        fake_audio_duration: float | None = None,
+        fake_exception: Exception | None = None,
+    ) -> None:
+        """Restore a pristine state so the same instance can be reused across tests."""
+        self._sample_rate = sample_rate
+        self._num_channels = num_channels
+        self._fake_timeout = fake_timeout
+        self._fake_audio_duration = fake_audio_duration
+        self._fake_exception = fake_exception
+        self._sleep = asyncio.sleep
+        self._fake_response_map.clear()
+
+        for ch in (self._synthesize_ch, self._stream_ch):
+            with contextlib.suppress(ChanEmpty):
+                while True:
+                    ch.recv_nowait()
+
     @property
-    def synthesize_ch(self) -> utils.aio.ChanReceiver[FakeChunkedStream]:
+    def synthesize_ch(self) -> _EventQueue[FakeChunkedStream]:
         return self._synthesize_ch
 
     @property
-    def stream_ch(self) -> utils.aio.ChanReceiver[FakeSynthesizeStream]:
+    def stream_ch(self) -> _EventQueue[FakeSynthesizeStream]:
         return self._stream_ch
 
     @property
@@ -131,13 +186,19 @@ class FakeChunkedStream(ChunkedStream):
 
         if self._tts._fake_timeout is not None:
             if self._tts._fake_timeout > self._conn_options.timeout:
-                await asyncio.sleep(self._conn_options.timeout)
+                await self._tts._sleep(self._conn_options.timeout)
                 raise APIConnectionError("timeout")
 
-            await asyncio.sleep(self._tts._fake_timeout)
+            await self._tts._sleep(self._tts._fake_timeout)
 
         start_time = time.perf_counter()
         if not (resp := self._tts.fake_response_map.get(self._input_text)):
+            if not self._tts._fake_audio_duration and self._tts._fake_exception is None:
+                # zero-duration synth emits nothing; skip the response/buffer
+                # setup and let the emitter raise its usual "no audio" error
+                output_emitter.flush()
+                return
+
             resp = FakeTTSResponse(
                 input=self._input_text,
                 audio_duration=self._tts._fake_audio_duration or 0.0,
@@ -146,15 +207,17 @@ class FakeChunkedStream(ChunkedStream):
             )
 
         if resp.audio_duration > 0.0:
-            await asyncio.sleep(resp.ttfb)
+            await self._tts._sleep(resp.ttfb)
 
             pushed_samples = 0
             max_samples = (
                 int(self._tts.sample_rate * resp.audio_duration + 0.5) * self._tts.num_channels
             )
             while pushed_samples < max_samples:
-                num_samples = min(self._tts.sample_rate // 100, max_samples - pushed_samples)
-                output_emitter.push(b"\x00\x00" * num_samples)
+                num_samples = min(
+                    self._tts.sample_rate * _CHUNK_MS // 1000, max_samples - pushed_samples
+                )
+                output_emitter.push(_SILENCE[: num_samples * 2])
                 pushed_samples += num_samples
 
         if self._tts._fake_exception is not None:
@@ -164,7 +227,7 @@ class FakeChunkedStream(ChunkedStream):
 
         delay = resp.duration - (time.perf_counter() - start_time)
         if delay > 0.0:
-            await asyncio.sleep(delay)
+            await self._tts._sleep(delay)
 
 
 class FakeSynthesizeStream(SynthesizeStream):
@@ -188,10 +251,10 @@ class FakeSynthesizeStream(SynthesizeStream):
 
         if self._tts._fake_timeout is not None:
             if self._tts._fake_timeout > self._conn_options.timeout:
-                await asyncio.sleep(self._conn_options.timeout)
+                await self._tts._sleep(self._conn_options.timeout)
                 raise APIConnectionError("timeout")
 
-            await asyncio.sleep(self._tts._fake_timeout)
+            await self._tts._sleep(self._tts._fake_timeout)
 
         output_emitter.initialize(
             request_id=utils.shortuuid("fake_tts_"),
@@ -212,6 +275,11 @@ class FakeSynthesizeStream(SynthesizeStream):
             start_time = time.perf_counter()
             self._mark_started()
             if not (resp := self._tts.fake_response_map.get(input_text)):
+                if not self._tts._fake_audio_duration:
+                    # zero-duration segment emits nothing; skip the response setup
+                    input_text = ""
+                    continue
+
                 resp = FakeTTSResponse(
                     input=input_text,
                     audio_duration=self._tts._fake_audio_duration or 0.0,
@@ -224,7 +292,7 @@ class FakeSynthesizeStream(SynthesizeStream):
                 continue
 
             if resp.ttfb > 0.0:
-                await asyncio.sleep(resp.ttfb - (time.perf_counter() - start_time))
+                await self._tts._sleep(resp.ttfb - (time.perf_counter() - start_time))
 
             output_emitter.start_segment(segment_id=utils.shortuuid("fake_segment_"))
 
@@ -233,13 +301,15 @@ class FakeSynthesizeStream(SynthesizeStream):
                 int(self._tts.sample_rate * resp.audio_duration + 0.5) * self._tts.num_channels
             )
             while pushed_samples < max_samples:
-                num_samples = min(self._tts.sample_rate // 100, max_samples - pushed_samples)
-                output_emitter.push(b"\x00\x00" * num_samples)
+                num_samples = min(
+                    self._tts.sample_rate * _CHUNK_MS // 1000, max_samples - pushed_samples
+                )
+                output_emitter.push(_SILENCE[: num_samples * 2])
                 pushed_samples += num_samples
 
             delay = resp.duration - (time.perf_counter() - start_time)
             if delay > 0.0:
-                await asyncio.sleep(delay)
+                await self._tts._sleep(delay)
 
             output_emitter.flush()
 
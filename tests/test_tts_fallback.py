@@ -2,17 +2,70 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+from collections import deque
+from collections.abc import AsyncIterable, Sequence
 
 import pytest
+import pytest_asyncio
 
-from livekit import rtc
-from livekit.agents import APIConnectionError, APIConnectOptions, APIError, utils
-from livekit.agents.tts import TTS, AvailabilityChangedEvent, FallbackAdapter
-from livekit.agents.tts.tts import SynthesizedAudio, SynthesizeStream
-from livekit.agents.utils.aio.channel import ChanEmpty
+from livekit.agents import APIConnectionError, APIConnectOptions, APIError
+from livekit.agents.tts import TTS, AvailabilityChangedEvent, ChunkedStream, FallbackAdapter
+from livekit.agents.tts.tts import SynthesizedAudio
 
 from .fake_tts import FakeTTS
 
+# run the whole module on one event loop so the FakeTTS pair below (channels,
+# emitters, buffers) can be built once and reused by every test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# conn options shared by the timeout tests; never varied, so build it once
+_FAST_OPTS = APIConnectOptions(timeout=0.1, max_retry=0)
+
+
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def fake_pair() -> tuple[FakeTTS, FakeTTS]:
+    return FakeTTS(), FakeTTS()
+
+
+async def _instant_sleep(_delay: float) -> None:
+    """Yield once so ordering is preserved, without the wall-clock wait."""
+    await asyncio.sleep(0)
+
+
+def _assert_state(
+    fallback_adapter: FallbackAdapterTester,
+    *,
+    synthesized: Sequence[FakeTTS] = (),
+    streamed: Sequence[FakeTTS] = (),
+    became_unavailable: Sequence[FakeTTS] = (),
+) -> None:
+    """Drain the signaling channels in one pass and check which fakes were exercised."""
+    for fake in synthesized:
+        assert fake.synthesize_ch.recv_nowait()
+    for fake in streamed:
+        assert fake.stream_ch.recv_nowait()
+    for fake in became_unavailable:
+        assert [ev.available for ev in fallback_adapter.drain_events(fake)] == [False]
+
+
+async def _expect_fail(stream: ChunkedStream, exc: type[Exception]) -> None:
+    """Drain a synthesis stream that is expected to raise."""
+    with pytest.raises(exc):
+        async with stream:
+            async for _ in stream:
+                pass
+
+
+async def _accumulate(stream: AsyncIterable[SynthesizedAudio]) -> tuple[int, int, bool]:
+    """Tally the emitted audio without materializing and re-copying the PCM."""
+    total_samples, sample_rate, is_final = 0, 0, False
+    async for data in stream:
+        total_samples += data.frame.samples_per_channel
+        sample_rate = data.frame.sample_rate
+        is_final = data.is_final
+
+    return total_samples, sample_rate, is_final
+
 
 class FallbackAdapterTester(FallbackAdapter):
     def __init__(
@@ -30,81 +83,94 @@ class FallbackAdapterTester(FallbackAdapter):
 
         self.on("tts_availability_changed", self._on_tts_availability_changed)
 
-        self._availability_changed_ch: dict[int, utils.aio.Chan[AvailabilityChangedEvent]] = {
-            id(t): utils.aio.Chan[AvailabilityChangedEvent]() for t in tts
-        }
+        # stash the event buffers on each tts: attribute access in the handler
+        # instead of an id()-keyed dict lookup per event
+        for t in tts:
+            t._availability_events = deque()  # type: ignore[attr-defined]
+            t._availability_updated = asyncio.Event()  # type: ignore[attr-defined]
 
     def _on_tts_availability_changed(self, ev: AvailabilityChangedEvent) -> None:
-        self._availability_changed_ch[id(ev.tts)].send_nowait(ev)
+        ev.tts._availability_events.append(ev)  # type: ignore[attr-defined]
+        ev.tts._availability_updated.set()  # type: ignore[attr-defined]
 
-    def availability_changed_ch(
-        self,
-        tts: TTS,
-    ) -> utils.aio.ChanReceiver[AvailabilityChangedEvent]:
-        return self._availability_changed_ch[id(tts)]
+    def drain_events(self, tts: TTS) -> list[AvailabilityChangedEvent]:
+        """Return every buffered availability event for the given tts in one call."""
+        events: deque[AvailabilityChangedEvent] = tts._availability_events  # type: ignore[attr-defined]
+        drained = list(events)
+        events.clear()
+        tts._availability_updated.clear()  # type: ignore[attr-defined]
+        return drained
 
+    async def wait_for_event(self, tts: TTS) -> AvailabilityChangedEvent:
+        events: deque[AvailabilityChangedEvent] = tts._availability_events  # type: ignore[attr-defined]
+        while not events:
+            tts._availability_updated.clear()  # type: ignore[attr-defined]
+            await tts._availability_updated.wait()  # type: ignore[attr-defined]
 
-async def test_tts_fallback() -> None:
-    fake1 = FakeTTS(fake_exception=APIConnectionError("fake1 failed"))
-    fake2 = FakeTTS(fake_audio_duration=5.0, sample_rate=48000)
+        return events.popleft()
 
-    fallback_adapter = FallbackAdapterTester([fake1, fake2])
 
-    async with fallback_adapter.synthesize("hello test") as stream:
-        frames = []
-        async for data in stream:
-            frames.append(data.frame)
+@pytest.mark.parametrize("method", ["synthesize", "stream"])
+async def test_tts_fallback(method: str, fake_pair: tuple[FakeTTS, FakeTTS]) -> None:
+    fake1, fake2 = fake_pair
+    fake1.reset(fake_exception=APIConnectionError("fake1 failed"))
+    fake2.reset(fake_audio_duration=5.0, sample_rate=48000)
 
-        assert fake1.synthesize_ch.recv_nowait()
-        assert fake2.synthesize_ch.recv_nowait()
+    fallback_adapter = FallbackAdapterTester([fake1, fake2])
 
-        assert rtc.combine_audio_frames(frames).duration == 5.01
+    if method == "synthesize":
+        async with fallback_adapter.synthesize("hello test") as stream:
+            total_samples, sample_rate, _ = await _accumulate(stream)
 
-    assert not fallback_adapter.availability_changed_ch(fake1).recv_nowait().available
+            _assert_state(fallback_adapter, synthesized=[fake1, fake2])
 
-    fake2.update_options(fake_audio_duration=0.0)
+            assert total_samples / sample_rate == 5.01
+    else:
+        async with fallback_adapter.stream() as stream:
+            stream.push_text("hello test")
+            stream.end_input()
 
-    with pytest.raises(APIConnectionError):
-        async with fallback_adapter.synthesize("hello test") as stream:
             async for _ in stream:
                 pass
 
-    assert not fallback_adapter.availability_changed_ch(fake2).recv_nowait().available
+            _assert_state(fallback_adapter, streamed=[fake1, fake2])
+
+    _assert_state(fallback_adapter, became_unavailable=[fake1])
+
+    if method == "synthesize":
+        # the streamed no-audio path is covered by test_no_audio
+        fake2.update_options(fake_audio_duration=0.0)
+
+        await _expect_fail(fallback_adapter.synthesize("hello test"), APIConnectionError)
+
+        _assert_state(fallback_adapter, became_unavailable=[fake2])
 
     await fallback_adapter.aclose()
 
 
-async def test_no_audio() -> None:
-    fake1 = FakeTTS(fake_audio_duration=0.0)
+async def test_no_audio(fake_pair: tuple[FakeTTS, FakeTTS]) -> None:
+    fake1, _ = fake_pair
+    fake1.reset(fake_audio_duration=0.0)
+    fake1._sleep = _instant_sleep
 
     fallback_adapter = FallbackAdapterTester([fake1])
 
-    with pytest.raises(APIConnectionError):
-        async with fallback_adapter.synthesize("hello test chunked") as stream:
-            async for _ in stream:
-                pass
+    await _expect_fail(fallback_adapter.synthesize("hello test chunked"), APIConnectionError)
 
     # stream
     fake1.update_options(fake_audio_duration=5.0)
 
-    async def _input_task(stream: SynthesizeStream, text: str):
-        with contextlib.suppress(RuntimeError):
-            stream.push_text(text)
-            stream.flush()
-            stream.end_input()
-
     async def _stream_task(text: str, audio_duration: float) -> None:
         fake1.update_options(fake_timeout=0.5, fake_audio_duration=audio_duration)
 
         async with fallback_adapter.stream() as stream:
-            input_task = asyncio.create_task(_input_task(stream, text))
+            # push_text/flush/end_input never await, no need for an input task
+            with contextlib.suppress(RuntimeError):
+                stream.push_text(text)
+                stream.flush()
+                stream.end_input()
 
-            segments = set()
-            try:
-                async for ev in stream:
-                    segments.add(ev.segment_id)
-            finally:
-                await input_task
+            segments = {ev.segment_id async for ev in stream}
 
             if audio_duration > 0.0:
                 assert len(segments) == 1
@@ -119,147 +185,112 @@ async def test_no_audio() -> None:
     await fallback_adapter.aclose()
 
 
-async def test_tts_stream_fallback() -> None:
-    fake1 = FakeTTS(fake_exception=APIConnectionError("fake1 failed"))
-    fake2 = FakeTTS(fake_audio_duration=5.0)
-
-    fallback_adapter = FallbackAdapterTester([fake1, fake2])
-
-    async with fallback_adapter.stream() as stream:
-        stream.push_text("hello test")
-        stream.end_input()
-
-        async for _ in stream:
-            pass
-
-        assert fake1.stream_ch.recv_nowait()
-        assert fake2.stream_ch.recv_nowait()
-
-    assert not fallback_adapter.availability_changed_ch(fake1).recv_nowait().available
-
-    await fallback_adapter.aclose()
-
-
-async def test_tts_recover() -> None:
-    fake1 = FakeTTS(fake_exception=APIConnectionError("fake1 failed"))
-    fake2 = FakeTTS(fake_exception=APIConnectionError("fake2 failed"), fake_timeout=0.5)
+async def test_tts_recover(fake_pair: tuple[FakeTTS, FakeTTS]) -> None:
+    fake1, fake2 = fake_pair
+    fake1.reset(fake_exception=APIConnectionError("fake1 failed"))
+    fake2.reset(fake_exception=APIConnectionError("fake2 failed"), fake_timeout=0.5)
 
     fallback_adapter = FallbackAdapterTester([fake1, fake2])
 
-    with pytest.raises(APIConnectionError):
-        async with fallback_adapter.synthesize("hello test") as stream:
-            async for _ in stream:
-                pass
+    await _expect_fail(fallback_adapter.synthesize("hello test"), APIConnectionError)
 
-        assert fake1.synthesize_ch.recv_nowait()
-        assert fake2.synthesize_ch.recv_nowait()
+    _assert_state(fallback_adapter, synthesized=[fake1, fake2])
 
     fake2.update_options(fake_exception=None, fake_audio_duration=5.0)
 
-    assert not fallback_adapter.availability_changed_ch(fake1).recv_nowait().available
-    assert not fallback_adapter.availability_changed_ch(fake2).recv_nowait().available
+    _assert_state(fallback_adapter, became_unavailable=[fake1])
+    assert not (await asyncio.wait_for(fallback_adapter.wait_for_event(fake2), 1.0)).available
 
-    assert (
-        await asyncio.wait_for(fallback_adapter.availability_changed_ch(fake2).recv(), 1.0)
-    ).available, "fake2 should have recovered"
+    assert (await asyncio.wait_for(fallback_adapter.wait_for_event(fake2), 1.0)).available, (
+        "fake2 should have recovered"
+    )
 
     async with fallback_adapter.synthesize("hello test") as stream:
         async for _ in stream:
             pass
 
-    assert fake1.synthesize_ch.recv_nowait()
-    assert fake2.synthesize_ch.recv_nowait()
+    _assert_state(fallback_adapter, synthesized=[fake1, fake2])
 
-    with pytest.raises(ChanEmpty):
-        fallback_adapter.availability_changed_ch(fake1).recv_nowait()
-
-    with pytest.raises(ChanEmpty):
-        fallback_adapter.availability_changed_ch(fake2).recv_nowait()
+    assert not fallback_adapter.drain_events(fake1)
+    assert not fallback_adapter.drain_events(fake2)
 
     await fallback_adapter.aclose()
 
 
-async def test_audio_resampled() -> None:
-    fake1 = FakeTTS(sample_rate=48000, fake_exception=APIConnectionError("fake1 failed"))
-    fake2 = FakeTTS(fake_audio_duration=5.0, sample_rate=16000)
+async def test_audio_resampled(fake_pair: tuple[FakeTTS, FakeTTS]) -> None:
+    fake1, fake2 = fake_pair
+    fake1.reset(sample_rate=48000, fake_exception=APIConnectionError("fake1 failed"))
+    fake2.reset(fake_audio_duration=5.0, sample_rate=16000)
 
     fallback_adapter = FallbackAdapterTester([fake1, fake2])
 
     async with fallback_adapter.synthesize("hello test") as stream:
-        frames: list[SynthesizedAudio] = []
-        async for data in stream:
-            frames.append(data)
-
-        assert fake1.synthesize_ch.recv_nowait()
-        assert fake2.synthesize_ch.recv_nowait()
+        total_samples, sample_rate, is_final = await _accumulate(stream)
 
-        assert not fallback_adapter.availability_changed_ch(fake1).recv_nowait().available
+        _assert_state(fallback_adapter, synthesized=[fake1, fake2], became_unavailable=[fake1])
 
-        assert frames[-1].is_final is True, "last frame should be final"
-
-        combined_frame = rtc.combine_audio_frames([f.frame for f in frames])
-        assert combined_frame.duration == 5.01
-        assert combined_frame.sample_rate == 48000
+        assert is_final is True, "last frame should be final"
+        assert total_samples / sample_rate == 5.01
+        assert sample_rate == 48000
 
     assert await asyncio.wait_for(fake1.synthesize_ch.recv(), 1.0)
 
+    # the 16kHz -> 48kHz resampler is built once per TTS in __init__; both the
+    # synthesize and stream paths below must reuse it rather than rebuilding
+    resampler = fallback_adapter._status[1].resampler
+    assert resampler is not None
+
     async with fallback_adapter.stream() as stream:
         stream.push_text("hello test")
         stream.end_input()
 
-        frames: list[SynthesizedAudio] = []
-        async for data in stream:
-            frames.append(data)
+        total_samples, sample_rate, is_final = await _accumulate(stream)
 
         assert fake2.stream_ch.recv_nowait()
 
-        assert frames[-1].is_final is True, "last frame should be final"
+        assert is_final is True, "last frame should be final"
+        assert total_samples / sample_rate == 5.01  # 5.0 + 0.01 final flag
+        assert sample_rate == 48000
 
-        combined_frame = rtc.combine_audio_frames([f.frame for f in frames])
-        assert combined_frame.duration == 5.01  # 5.0 + 0.01 final flag
-        assert combined_frame.sample_rate == 48000
+    assert fallback_adapter._status[1].resampler is resampler
 
     await fallback_adapter.aclose()
 
 
-async def test_timeout():
-    fake1 = FakeTTS(fake_timeout=0.5, sample_rate=48000)
-    fake2 = FakeTTS(fake_timeout=0.5, sample_rate=48000)
+async def test_timeout(fake_pair: tuple[FakeTTS, FakeTTS]):
+    fake1, fake2 = fake_pair
+    fake1.reset(fake_timeout=0.5, sample_rate=48000)
+    fake2.reset(fake_timeout=0.5, sample_rate=48000)
+    fake1._sleep = fake2._sleep = _instant_sleep
 
     fallback_adapter = FallbackAdapterTester([fake1, fake2])
 
-    with pytest.raises(APIConnectionError):
-        async with fallback_adapter.synthesize(
-            "hello test",
-            conn_options=APIConnectOptions(timeout=0.1, max_retry=0),
-        ) as stream:
-            async for _ in stream:
-                pass
-
-    assert fake1.synthesize_ch.recv_nowait()
-    assert fake2.synthesize_ch.recv_nowait()
+    await _expect_fail(
+        fallback_adapter.synthesize("hello test", conn_options=_FAST_OPTS), APIConnectionError
+    )
 
-    assert not fallback_adapter.availability_changed_ch(fake1).recv_nowait().available
-    assert not fallback_adapter.availability_changed_ch(fake2).recv_nowait().available
+    _assert_state(fallback_adapter, synthesized=[fake1, fake2], became_unavailable=[fake1, fake2])
 
-    assert await asyncio.wait_for(fake1.synthesize_ch.recv(), 1.0)
-    assert await asyncio.wait_for(fake2.synthesize_ch.recv(), 1.0)
+    # one deadline timer for both recovery waits instead of one per recv
+    assert all(
+        await asyncio.wait_for(
+            asyncio.gather(fake1.synthesize_ch.recv(), fake2.synthesize_ch.recv()), 1.0
+        )
+    )
 
     # stream
     with pytest.raises(APIConnectionError):
-        async with fallback_adapter.stream(
-            conn_options=APIConnectOptions(timeout=0.1, max_retry=0)
-        ) as stream:
+        async with fallback_adapter.stream(conn_options=_FAST_OPTS) as stream:
             stream.push_text("hello test")
             stream.end_input()
 
             async for _ in stream:
                 pass
 
-    assert fake1.stream_ch.recv_nowait()
-    assert fake2.stream_ch.recv_nowait()
+    _assert_state(fallback_adapter, streamed=[fake1, fake2])
 
-    assert await asyncio.wait_for(fake1.stream_ch.recv(), 1.0)
-    assert await asyncio.wait_for(fake2.stream_ch.recv(), 1.0)
+    assert all(
+        await asyncio.wait_for(asyncio.gather(fake1.stream_ch.recv(), fake2.stream_ch.recv()), 1.0)
+    )
 
     await fallback_adapter.aclose()